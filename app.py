@@ -10,7 +10,7 @@ import os
 from src.perplexity_client import PerplexityClient
 from src.content_formatter import ContentFormatter
 from src.platform_preview import PlatformPreview
-from src.social_integrations import SocialMediaManager, display_platform_connection_ui, get_platform_tier_info
+from src.social_integrations import get_social_manager, display_platform_connection_ui, get_platform_tier_info
 from src.database import ContentDatabase
 from src.utils import get_platform_info, generate_content_hash
 
@@ -344,8 +344,7 @@ def initialize_perplexity_client():
 # Initialize session state
 if 'generated_content' not in st.session_state:
     st.session_state.generated_content = {}
-if 'social_manager' not in st.session_state:
-    st.session_state.social_manager = SocialMediaManager()
+get_social_manager()
 if 'db' not in st.session_state:
     st.session_state.db = ContentDatabase()
 
@@ -713,7 +712,7 @@ elif page == "🔗 Connect Accounts":
     """)
     
     # Display connection status overview
-    manager = st.session_state.social_manager
+    manager = get_social_manager()
     platform_status = manager.get_all_platform_status()
     
     # Connection status cards
@@ -770,7 +769,7 @@ elif page == "📅 Schedule & Publish":
     if not st.session_state.generated_content:
         st.info("No content generated yet. Go to 'Generate Content' first.")
     else:
-        manager = st.session_state.social_manager
+        manager = get_social_manager()
         connected_platforms = manager.get_connected_platforms()
         
         if not connected_platforms:
@@ -827,42 +826,35 @@ elif page == "📅 Schedule & Publish":
                                     for platform in selected_platforms
                                 }
                                 
-                                # Publish to each platform with progress updates
-                                results = {}
-                                for i, platform in enumerate(selected_platforms):
-                                    status_text.text(f"📤 Publishing to {platform.title()}...")
-                                    progress_bar.progress((i) / total_platforms)
+                                # Publish to all platforms concurrently; results are
+                                # rendered here as each platform finishes
+                                if "bluesky" in selected_platforms and len(content_dict.get("bluesky", "")) > 280:
+                                    status_text.text(f"🧵 Creating Bluesky thread...")
+                                else:
+                                    status_text.text(f"📤 Publishing to {', '.join(p.title() for p in selected_platforms)}...")
+                                finished = []
+                                
+                                def show_result(platform, result):
+                                    success, message = result
+                                    finished.append(platform)
+                                    progress_bar.progress(len(finished) / total_platforms)
                                     
-                                    platform_obj = manager.get_platform(platform)
-                                    if platform_obj and platform_obj.is_connected:
-                                        content = content_dict.get(platform, "")
-                                        if content:
-                                            # Show special message for Bluesky threading
-                                            if platform == "bluesky" and len(content) > 280:
-                                                status_text.text(f"🧵 Creating Bluesky thread...")
-                                            
-                                            success, message = platform_obj.post_content(content)
-                                            results[platform] = (success, message)
-                                            
-                                            # Show immediate result
-                                            with results_container:
-                                                if success:
-                                                    if "thread" in message.lower():
-                                                        st.success(f"🧵 {platform.title()}: {message}")
-                                                    else:
-                                                        st.success(f"✅ {platform.title()}: {message}")
-                                                else:
-                                                    st.error(f"❌ {platform.title()}: {message}")
+                                    # Show immediate result
+                                    with results_container:
+                                        if success:
+                                            if "thread" in message.lower():
+                                                st.success(f"🧵 {platform.title()}: {message}")
+                                            else:
+                                                st.success(f"✅ {platform.title()}: {message}")
                                         else:
-                                            results[platform] = (False, "No content provided for this platform")
-                                            with results_container:
-                                                st.error(f"❌ {platform.title()}: No content provided")
-                                    else:
-                                        results[platform] = (False, "Platform not connected")
-                                        with results_container:
-                                            st.error(f"❌ {platform.title()}: Platform not connected")
-                                    
-                                    progress_bar.progress((i + 1) / total_platforms)
+                                            st.error(f"❌ {platform.title()}: {message}")
+                                
+                                results = manager.post_to_multiple_platforms(
+                                    content_dict, selected_platforms, on_result=show_result
+                                )
+                                # Posting may have refreshed (rotated) auth tokens in the worker
+                                # threads; save them here, where session state is available
+                                manager.save_connections()
                                 
                                 # Final status
                                 status_text.text("✅ Publishing complete!")
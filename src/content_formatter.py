@@ -90,7 +90,7 @@ class ContentFormatter:
         if include_hashtags:
             hashtags = self._generate_hashtags(content, config["hashtag_limit"], "professional")
             if hashtags:
-                formatted += f"\n\n{' '.join(hashtags)}"
+                formatted = ''.join([formatted, "\n\n", ' '.join(hashtags)])
         
         # Trim to character limit
         formatted = self._trim_to_limit(formatted, config["char_limit"])
@@ -118,7 +118,7 @@ class ContentFormatter:
         
         # Add hashtags
         if hashtags:
-            formatted += f" {hashtag_text}"
+            formatted = ''.join([formatted, " ", hashtag_text])
         
         return formatted
     
@@ -142,7 +142,7 @@ class ContentFormatter:
             formatted = formatted[:available_chars-3].strip() + "..."
         
         if hashtags:
-            formatted += f" {hashtag_text}"
+            formatted = ''.join([formatted, " ", hashtag_text])
         
         return formatted
     
@@ -166,7 +166,7 @@ class ContentFormatter:
             formatted = formatted[:available_chars-3].strip() + "..."
         
         if hashtags:
-            formatted += f" {hashtag_text}"
+            formatted = ''.join([formatted, " ", hashtag_text])
         
         return formatted
     
@@ -177,7 +177,7 @@ class ContentFormatter:
         if include_hashtags:
             hashtags = self._generate_hashtags(content, 2, tone)
             if hashtags:
-                formatted += f"\n\n{' '.join(hashtags)}"
+                formatted = ''.join([formatted, "\n\n", ' '.join(hashtags)])
         
         return formatted
     
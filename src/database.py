@@ -2,6 +2,55 @@ import sqlite3
 import json
 from datetime import datetime
 import os
+import atexit
+import queue
+import threading
+
+# Maximum number of queued rows committed in a single transaction
+WRITE_BATCH_SIZE = 64
+
+# History writes are off the request path: one daemon thread per process
+# drains this queue of (db_path, row) items and commits rows in batches
+_write_q = queue.Queue()
+_writer_lock = threading.Lock()
+_writer_started = False
+
+def _ensure_writer():
+    """Start the shared writer thread on first use"""
+    global _writer_started
+    with _writer_lock:
+        if not _writer_started:
+            threading.Thread(target=_writer_loop, daemon=True).start()
+            atexit.register(_write_q.join)
+            _writer_started = True
+
+def _writer_loop():
+    """Drain the write queue, committing each batch in one transaction per database"""
+    while True:
+        items = [_write_q.get()]
+        while len(items) < WRITE_BATCH_SIZE:
+            try:
+                items.append(_write_q.get_nowait())
+            except queue.Empty:
+                break
+        
+        rows_by_path = {}
+        for db_path, row in items:
+            rows_by_path.setdefault(db_path, []).append(row)
+        
+        try:
+            for db_path, rows in rows_by_path.items():
+                try:
+                    with sqlite3.connect(db_path) as conn:
+                        conn.executemany('''
+                            INSERT INTO content_history (topic, platform, content, metadata)
+                            VALUES (?, ?, ?, ?)
+                        ''', rows)
+                except Exception as e:
+                    print(f"Error storing content: {e}")
+        finally:
+            for _ in items:
+                _write_q.task_done()
 
 class ContentDatabase:
     def __init__(self, db_path="data/content_generator.db"):
@@ -10,6 +59,7 @@ class ContentDatabase:
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.db_path = db_path
         self.init_database()
+        _ensure_writer()
     
     def init_database(self):
         """Initialize database tables"""
@@ -31,22 +81,17 @@ class ContentDatabase:
             print(f"Database initialization error: {e}")
     
     def store_content(self, topic, platform, content, metadata=None):
-        """Store generated content"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO content_history (topic, platform, content, metadata)
-                    VALUES (?, ?, ?, ?)
-                ''', (topic, platform, content, json.dumps(metadata) if metadata else None))
-                conn.commit()
-                return True
-        except Exception as e:
-            print(f"Error storing content: {e}")
-            return False
+        """Queue generated content for storage; True means queued, not yet written"""
+        _write_q.put((self.db_path, (topic, platform, content, json.dumps(metadata) if metadata else None)))
+        return True
+    
+    def flush(self):
+        """Block until all queued content has been written"""
+        _write_q.join()
     
     def get_content_history(self, limit=50):
         """Get recent content history"""
+        self.flush()
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
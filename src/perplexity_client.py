@@ -6,6 +6,27 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Prompt templates, filled in with str.format_map on each request
+_USER_PROMPT_TMPL = """Create a {content_type} post about "{topic}" for {platform}. 
+
+Requirements:
+- Research current information about {topic}
+- Include practical insights valuable to the audience
+- Use platform-appropriate formatting and tone
+- Make it engaging to encourage interaction
+
+IMPORTANT: Provide ONLY the final social media post text - no explanations, no reasoning process, just the post content that's ready to publish."""
+
+_REFINEMENT_USER_PROMPT_TMPL = """ORIGINAL CONTENT:
+{original_content}
+
+REFINEMENT REQUEST:
+{refinement_request}
+
+PLATFORM: {platform}
+
+Please refine the original content according to the refinement request. Provide ONLY the improved social media post content - nothing else."""
+
 class PerplexityClient:
     """
     Client for interacting with Perplexity's Sonar Reasoning API.
@@ -201,31 +222,19 @@ Your refined content should be an improved version that addresses the user's spe
         """
         Create a user prompt based on topic, content type, and platform.
         """
-        # Handle different topic formats
-        topic_key = topic.lower().replace(" ", "_")
-        
-        # Create a comprehensive prompt that works for any topic
-        return f"""Create a {content_type} post about "{topic}" for {platform}. 
-
-Requirements:
-- Research current information about {topic}
-- Include practical insights valuable to the audience
-- Use platform-appropriate formatting and tone
-- Make it engaging to encourage interaction
-
-IMPORTANT: Provide ONLY the final social media post text - no explanations, no reasoning process, just the post content that's ready to publish."""
+        return _USER_PROMPT_TMPL.format_map({
+            "topic": topic,
+            "content_type": content_type,
+            "platform": platform
+        })
     
     def _create_refinement_user_prompt(self, original_content: str, refinement_request: str, platform: str) -> str:
         """Create user prompt for content refinement."""
-        return f"""ORIGINAL CONTENT:
-{original_content}
-
-REFINEMENT REQUEST:
-{refinement_request}
-
-PLATFORM: {platform}
-
-Please refine the original content according to the refinement request. Provide ONLY the improved social media post content - nothing else."""
+        return _REFINEMENT_USER_PROMPT_TMPL.format_map({
+            "original_content": original_content,
+            "refinement_request": refinement_request,
+            "platform": platform
+        })
 
 
 # Example usage and testing
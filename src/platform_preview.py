@@ -1,112 +1,172 @@
 import streamlit as st
+from typing import Dict
 from .content_formatter import ContentFormatter
 
+# Shared by every PlatformPreview; ContentFormatter only reads its config after
+# construction, so one instance is safe to reuse across reruns and threads
+_FORMATTER = ContentFormatter()
+
+# Escapes HTML-significant characters and turns newlines into line breaks
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br>"})
+
+# Static per-platform display settings, built once at import time
+_PLATFORM_CONFIGS = {
+    "linkedin": {
+        "name": "LinkedIn",
+        "icon": "💼",
+        "color": "#0077b5",
+        "char_limit": 1300,
+        "description": "Professional network"
+    },
+    "twitter": {
+        "name": "Twitter/X",
+        "icon": "🐦",
+        "color": "#1da1f2",
+        "char_limit": 280,
+        "description": "Microblogging platform"
+    },
+    "bluesky": {
+        "name": "Bluesky",
+        "icon": "🟦",
+        "color": "#00a8e8",
+        "char_limit": 300,
+        "description": "Decentralized social network"
+    },
+    "threads": {
+        "name": "Threads",
+        "icon": "🧵",
+        "color": "#000000",
+        "description": "Text-based conversation app"
+    }
+}
+
+# Precompute char_limit * 11 so "more than 10% over the limit" is an integer compare
+for _config in _PLATFORM_CONFIGS.values():
+    if "char_limit" in _config:
+        _config["char_limit_110"] = _config["char_limit"] * 11
+
+# Char count colors indexed by how far over the limit the content is
+_CHAR_COLORS = ("green", "orange", "red")
+
+# Per-platform tips as (char limit to warn over, warning, tip)
+_TIPS = {
+    "twitter": (280, "⚠️ Content exceeds Twitter's 280 character limit",
+                "💡 Twitter tip: Use engaging hooks and clear calls-to-action"),
+    "linkedin": (None, None,
+                 "💡 LinkedIn tip: Professional tone works best. Consider adding industry insights"),
+    "bluesky": (300, "⚠️ Content exceeds Bluesky's 300 character limit",
+                "💡 Bluesky tip: Community-focused content performs well"),
+    "threads": (None, None,
+                "💡 Threads tip: Visual content and conversation starters work great")
+}
+
+# Tip/warning callouts styled like st.info/st.warning, prebuilt so both can be
+# emitted in one markdown element. Styles are inline so every rerun is self-contained;
+# text inherits the theme colour and only the translucent tint and border carry the
+# callout colour, so they stay readable on both light and dark themes.
+_INFO_STYLE = "background: rgba(28, 131, 225, 0.1); border-left: 4px solid rgba(28, 131, 225, 0.6); color: inherit; padding: 16px; border-radius: 8px; margin: 0 0 16px 0;"
+_WARNING_STYLE = "background: rgba(255, 189, 69, 0.15); border-left: 4px solid rgba(255, 189, 69, 0.8); color: inherit; padding: 16px; border-radius: 8px; margin: 0 0 16px 0;"
+_TIP_HTML = {name: f'<div style="{_INFO_STYLE}">{tip}</div>' for name, (_, _, tip) in _TIPS.items()}
+_WARNING_HTML = {
+    name: (limit, f'<div style="{_WARNING_STYLE}">{warning}</div>')
+    for name, (limit, warning, _) in _TIPS.items()
+    if limit
+}
+
+# Constant fragments of the preview markup, assembled with str.join
+_HEADER_OPEN = '<div style="'
+_HEADER_TITLE = '"><h3>'
+_HEADER_DESCRIPTION = '</h3><p style="margin: 0; color: #666;">'
+_HEADER_CLOSE = '</p></div>'
+_PREVIEW_ROW_OPEN = (
+    '<div style="display: flex; justify-content: space-between; align-items: center;">'
+    '<strong>Content Preview:</strong>'
+)
+_PREVIEW_ROW_CLOSE = '</div>'
+_CHAR_COUNT_CLOSE = " chars</span>"
+_PREVIEW_BOX_OPEN = (
+    '<div style="background: #f8f9fa; padding: 15px; border-radius: 8px; '
+    'border: 1px solid #e9ecef; margin: 10px 0; '
+    "font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; "
+    'line-height: 1.4;">'
+)
+_PREVIEW_BOX_CLOSE = '</div>'
+
+# Color-dependent styles, baked per platform / per char count color at import time
+_HEADER_STYLES = {
+    name: (
+        f"background: linear-gradient(90deg, {config['color']}22, {config['color']}11); "
+        f"padding: 15px; border-radius: 10px; border-left: 4px solid {config['color']}; margin: 10px 0;"
+    )
+    for name, config in _PLATFORM_CONFIGS.items()
+}
+_CHAR_COUNT_OPENS = tuple(f"<span style='color: {color}; font-weight: bold;'>" for color in _CHAR_COLORS)
+
+def _render_header(name: str, config: Dict) -> str:
+    """Render the static header block for a platform."""
+    return "".join((
+        _HEADER_OPEN, _HEADER_STYLES[name],
+        _HEADER_TITLE, config["icon"], " ", config["name"],
+        _HEADER_DESCRIPTION, config["description"], _HEADER_CLOSE
+    ))
+
+# Headers only depend on static config, so render them once at import time
+_PLATFORM_HEADERS = {name: _render_header(name, config) for name, config in _PLATFORM_CONFIGS.items()}
+
+@st.cache_data(max_entries=128)
+def _build_preview_html(platform: str, content: str, char_count: int) -> str:
+    """Build the complete preview markup: header, char count row and preview box."""
+    config = _PLATFORM_CONFIGS.get(platform, _PLATFORM_CONFIGS["linkedin"])
+    
+    # Character count display
+    if "char_limit" in config:
+        char_limit = config["char_limit"]
+        over = char_count > char_limit
+        way_over = char_count * 10 > config["char_limit_110"]
+        char_count_parts = (
+            _CHAR_COUNT_OPENS[over + way_over], str(char_count), "/", str(char_limit), _CHAR_COUNT_CLOSE
+        )
+    else:
+        char_count_parts = (_CHAR_COUNT_OPENS[0], str(char_count), _CHAR_COUNT_CLOSE)
+    
+    return "".join((
+        _PLATFORM_HEADERS.get(platform, _PLATFORM_HEADERS["linkedin"]),
+        _PREVIEW_ROW_OPEN, *char_count_parts, _PREVIEW_ROW_CLOSE,
+        _PREVIEW_BOX_OPEN, content.translate(_HTML_ESCAPE), _PREVIEW_BOX_CLOSE
+    ))
+
 class PlatformPreview:
     """Display platform-specific content previews."""
     
     def __init__(self):
-        self.formatter = ContentFormatter()
+        self.formatter = _FORMATTER
     
     def display_platform_preview(self, platform: str, content: str):
         """Display a preview of content formatted for a specific platform."""
+        platform_l = platform.lower()
         
-        platform_configs = {
-            "linkedin": {
-                "name": "LinkedIn",
-                "icon": "💼",
-                "color": "#0077b5",
-                "char_limit": 1300,
-                "description": "Professional network"
-            },
-            "twitter": {
-                "name": "Twitter/X", 
-                "icon": "🐦",
-                "color": "#1da1f2",
-                "char_limit": 280,
-                "description": "Microblogging platform"
-            },
-            "bluesky": {
-                "name": "Bluesky",
-                "icon": "🟦", 
-                "color": "#00a8e8",
-                "char_limit": 300,
-                "description": "Decentralized social network"
-            },
-            "threads": {
-                "name": "Threads",
-                "icon": "🧵",
-                "color": "#000000", 
-                "description": "Text-based conversation app"
-            }
-        }
-        
-        config = platform_configs.get(platform.lower(), platform_configs["linkedin"])
+        # Nothing to preview yet (first load or cleared editor)
+        if not content:
+            config = _PLATFORM_CONFIGS.get(platform_l, _PLATFORM_CONFIGS["linkedin"])
+            st.info(f"No content yet for {config['name']}")
+            return
         
-        # Platform header
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(90deg, {config['color']}22, {config['color']}11);
-            padding: 15px;
-            border-radius: 10px;
-            border-left: 4px solid {config['color']};
-            margin: 10px 0;
-        ">
-            <h3>{config['icon']} {config['name']}</h3>
-            <p style="margin: 0; color: #666;">{config['description']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Character count and content preview
+        # Header, char count and content preview in a single element. Reruns
+        # with unchanged content reuse the markup from the last render.
         char_count = len(content)
-        char_limit = config.get("char_limit", 1000)
-        
-        # Character count display
-        if char_count <= char_limit:
-            char_color = "green"
-        elif char_count <= char_limit * 1.1:
-            char_color = "orange" 
+        state_key = f"_pp_{platform_l}"
+        last_render = st.session_state.get(state_key)
+        if last_render is not None and last_render[0] == content:
+            preview_html = last_render[1]
         else:
-            char_color = "red"
-            
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.markdown(f"**Content Preview:**")
-        
-        with col2:
-            if "char_limit" in config:
-                st.markdown(f"<span style='color: {char_color}; font-weight: bold;'>{char_count}/{char_limit} chars</span>", unsafe_allow_html=True)
-            else:
-                st.markdown(f"<span style='color: green; font-weight: bold;'>{char_count} chars</span>", unsafe_allow_html=True)
-        
-        # Content preview box
-        st.markdown(f"""
-        <div style="
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 8px;
-            border: 1px solid #e9ecef;
-            margin: 10px 0;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.4;
-        ">
-            {content.replace(chr(10), '<br>')}
-        </div>
-        """, unsafe_allow_html=True)
+            preview_html = _build_preview_html(platform_l, content, char_count)
+            st.session_state[state_key] = (content, preview_html)
+        st.markdown(preview_html, unsafe_allow_html=True)
         
-        # Platform-specific tips
-        if platform.lower() == "twitter":
-            if char_count > 280:
-                st.warning("⚠️ Content exceeds Twitter's 280 character limit")
-            st.info("💡 Twitter tip: Use engaging hooks and clear calls-to-action")
-            
-        elif platform.lower() == "linkedin":
-            st.info("💡 LinkedIn tip: Professional tone works best. Consider adding industry insights")
-            
-        elif platform.lower() == "bluesky":
-            if char_count > 300:
-                st.warning("⚠️ Content exceeds Bluesky's 300 character limit")
-            st.info("💡 Bluesky tip: Community-focused content performs well")
-            
-        elif platform.lower() == "threads":
-            st.info("💡 Threads tip: Visual content and conversation starters work great")
+        # Platform-specific tips, with the over-limit warning first when triggered
+        callout = _TIP_HTML.get(platform_l, "")
+        limit_warning = _WARNING_HTML.get(platform_l)
+        if limit_warning and char_count > limit_warning[0]:
+            callout = limit_warning[1] + callout
+        if callout:
+            st.markdown(callout, unsafe_allow_html=True)
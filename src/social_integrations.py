@@ -1,19 +1,124 @@
 import os
+import re
+import base64
 import json
 import time
+import logging
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import accumulate
+import orjson
 import requests
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
 import streamlit as st
 
+log = logging.getLogger(__name__)
+
+# Load environment variables from .env file
+load_dotenv()
+
+# LOG_LEVEL (see .env.example) sets the level for every integration in this
+# module; LOG_LEVEL=DEBUG adds request/response details. Failures are WARNING.
+_log_level = getattr(logging, os.environ.get("LOG_LEVEL", "").upper(), None)
+if isinstance(_log_level, int):
+    log.setLevel(_log_level)
+    # Streamlit re-executes modules on file change; don't stack handlers
+    if not log.handlers:
+        log.addHandler(logging.StreamHandler())
+
+# Existing thread indicators, removed in one pass before re-splitting:
+# "**Thread 1/3***", "Thread 1/3:", "(1/3)" anywhere, and "1/3:" at the start of the
+# content only, so fractions opening later lines ("3/4 of developers") are kept
+_THREAD_INDICATOR_RE = re.compile(
+    r'\*\*Thread\s+\d+/\d+\*\*\*?|Thread\s+\d+/\d+:?|\(\d+/\d+\)|\A\d+/\d+:?\s*',
+    re.IGNORECASE
+)
+
+def _format_created_at(ts: datetime) -> str:
+    """Format a UTC datetime as an AT Protocol createdAt timestamp."""
+    return ts.isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+# Refresh the Bluesky access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 60
+
+def _jwt_expiry(token: Optional[str]) -> Optional[float]:
+    """Read the exp claim (epoch seconds) from a JWT without verifying it."""
+    try:
+        payload = token.split(".")[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+def _parse_response(response: requests.Response) -> Dict:
+    """Parse a JSON response body once; empty or non-object bodies give {}."""
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+# Longest Retry-After (seconds) honoured per retry; requests run on or block the
+# Streamlit script thread, so a server asking for longer still only gets this
+RETRY_AFTER_CAP = 3.0
+
+class _CappedRetry(Retry):
+    """Retry policy that clamps server-sent Retry-After delays to RETRY_AFTER_CAP."""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_CAP)
+
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session so repeated API calls reuse TLS connections."""
+    # createRecord/ugcPosts are not idempotent, so only retry when the server
+    # says the request was not processed: 429, or 503 with a Retry-After header
+    # (urllib3's Retry-After statuses). Failed connects are retried; read and
+    # other errors after the request was sent are not, to avoid duplicate posts.
+    retry = _CappedRetry(
+        total=3,
+        read=0,
+        other=0,
+        backoff_factor=0.3,
+        status_forcelist=[429],
+        allowed_methods=["POST", "GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    http = requests.Session()
+    http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    http.headers.update({"Content-Type": "application/json"})
+    return http
+
 class SocialMediaIntegrationBase:
     """Base class for social media platform integrations."""
     
+    # Auth attributes saved with the connection state so a rebuilt manager stays logged in
+    session_token_attrs: Tuple[str, ...] = ()
+    
     def __init__(self, platform_name: str):
         self.platform_name = platform_name
         self.is_connected = False
         self.user_info = {}
     
+    @property
+    def user_info(self) -> Dict:
+        """Profile info for the connected account."""
+        return self._user_info
+    
+    @user_info.setter
+    def user_info(self, info: Dict):
+        # Resolve the "Connected as" label once here instead of on every rerun
+        self._user_info = info
+        self.display_name = info.get("handle") or info.get("name") or "User"
+    
     def connect(self, credentials: Dict) -> Tuple[bool, str]:
         """Connect to the platform. Returns (success, message)"""
         raise NotImplementedError
@@ -22,6 +127,9 @@ class SocialMediaIntegrationBase:
         """Disconnect from the platform."""
         self.is_connected = False
         self.user_info = {}
+        # Drop auth tokens so the next save doesn't keep them for a disconnected account
+        for attr in self.session_token_attrs:
+            setattr(self, attr, None)
     
     def post_content(self, content: str, media_urls: List[str] = None) -> Tuple[bool, str]:
         """Post content to the platform. Returns (success, message/post_id)"""
@@ -38,12 +146,16 @@ class SocialMediaIntegrationBase:
 class BlueskyIntegration(SocialMediaIntegrationBase):
     """Bluesky (AT Protocol) integration - FREE TIER with Optimized Threading"""
     
+    session_token_attrs = ("access_jwt", "refresh_jwt")
+    
     def __init__(self):
         super().__init__("Bluesky")
         self.base_url = "https://bsky.social"
         self.session = None
         self.access_jwt = None
         self.refresh_jwt = None
+        self._access_exp = None
+        self._http = _create_http_session()
     
     def connect(self, credentials: Dict) -> Tuple[bool, str]:
         """Connect to Bluesky using username/password."""
@@ -52,12 +164,8 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
             password = credentials.get("password", "")
             
             # DEBUG: Print username details
-            print(f"🔍 DEBUG - Attempting Bluesky connection:")
-            print(f"Username: '{username}'")
-            print(f"Username length: {len(username)}")
-            print(f"Username repr: {repr(username)}")
-            print(f"Has @ symbol: {'@' in username}")
-            print(f"Password length: {len(password)}")
+            log.debug("🔍 Attempting Bluesky connection: username=%r (%d chars, has @: %s), password %d chars",
+                      username, len(username), '@' in username, len(password))
             
             if not username or not password:
                 return False, "Username and password are required"
@@ -67,7 +175,7 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
             if clean_username.startswith('@'):
                 clean_username = clean_username[1:]
             
-            print(f"🧹 Cleaned username: '{clean_username}'")
+            log.debug("🧹 Cleaned username: %r", clean_username)
             
             # Create session
             session_url = f"{self.base_url}/xrpc/com.atproto.server.createSession"
@@ -76,42 +184,54 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
                 "password": password
             }
             
-            print(f"🌐 Making request to: {session_url}")
-            print(f"📤 Request data: {{'identifier': '{clean_username}', 'password': '[HIDDEN]'}}")
+            log.debug("🌐 Making request to: %s (identifier=%r, password=[HIDDEN])", session_url, clean_username)
+            
+            response = self._http.post(session_url, json=session_data)
             
-            response = requests.post(session_url, json=session_data)
+            session_info = _parse_response(response)
             
-            print(f"📥 Response status: {response.status_code}")
+            log.debug("📥 Response status: %d", response.status_code)
             if response.status_code != 200:
-                print(f"❌ Response content: {response.text}")
+                log.debug("❌ Response content: %s", session_info)
             
             if response.status_code == 200:
-                session_info = response.json()
                 self.access_jwt = session_info.get("accessJwt")
                 self.refresh_jwt = session_info.get("refreshJwt")
+                self._access_exp = _jwt_expiry(self.access_jwt)
                 self.user_info = {
                     "handle": session_info.get("handle"),
                     "did": session_info.get("did"),
                     "displayName": session_info.get("displayName", "")
                 }
                 self.is_connected = True
-                print(f"✅ Connection successful! Handle: {self.user_info['handle']}")
+                log.info("✅ Bluesky connection successful! Handle: %s", self.user_info['handle'])
                 return True, f"Successfully connected to Bluesky as @{self.user_info['handle']}"
             else:
-                error_msg = response.json().get("message", "Authentication failed")
-                print(f"❌ Connection failed: {error_msg}")
+                error_msg = session_info.get("message", "Authentication failed")
+                log.warning("❌ Bluesky connection failed (HTTP %d): %s", response.status_code, error_msg)
                 return False, f"Bluesky connection failed: {error_msg}"
                 
         except Exception as e:
-            print(f"💥 Exception during connection: {str(e)}")
+            log.error("💥 Exception during Bluesky connection: %s", e)
             return False, f"Bluesky connection error: {str(e)}"
     
+    def disconnect(self):
+        """Disconnect from Bluesky and release pooled connections."""
+        super().disconnect()
+        self._access_exp = None
+        self._http.close()
+    
     def _split_content_intelligently(self, content: str, max_length: int = 300) -> List[str]:
         """Split content intelligently for threading with optimal character usage."""
-        # First, clean any existing thread indicators from the content
-        clean_content = self._clean_existing_thread_indicators(content)
+        # First, clean any existing thread indicators from the content. Every
+        # indicator contains "n/m", so content without a slash only needs its
+        # whitespace normalized and can skip the regex pass.
+        if '/' in content:
+            clean_content = self._clean_existing_thread_indicators(content)
+        else:
+            clean_content = ' '.join(content.split())
         
-        print(f"🧹 Cleaned content length: {len(clean_content)} characters")
+        log.debug("🧹 Cleaned content length: %d characters", len(clean_content))
         
         if len(clean_content) <= max_length:
             return [clean_content]
@@ -141,51 +261,39 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
     
     def _clean_existing_thread_indicators(self, content: str) -> str:
         """Remove any existing thread indicators from content."""
-        import re
+        cleaned = _THREAD_INDICATOR_RE.sub('', content)
         
-        # Remove patterns like "**Thread 1/3***", "Thread 1/2:", "(1/3)", etc.
-        patterns = [
-            r'\*\*Thread\s+\d+/\d+\*\*\*?',  # **Thread 1/3*** or **Thread 1/3**
-            r'Thread\s+\d+/\d+:?',           # Thread 1/3: or Thread 1/3
-            r'\(\d+/\d+\)',                  # (1/3)
-            r'^\d+/\d+:?\s*',                # 1/3: or 1/3 at start
-            r'^\(\d+/\d+\)\s*',              # (1/3) at start
-        ]
-        
-        cleaned = content
-        for pattern in patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Clean up extra whitespace and line breaks
-        cleaned = re.sub(r'\s+', ' ', cleaned)  # Multiple spaces to single space
-        cleaned = cleaned.strip()
-        
-        return cleaned
+        # Collapse whitespace runs and line breaks to single spaces and strip the ends
+        return ' '.join(cleaned.split())
     
     def _split_by_sentences(self, content: str, max_length: int) -> List[str]:
         """Split content by sentences."""
         sentences = content.split('. ')
         threads = []
-        current_thread = ""
+        # Sentences of the thread being built, and its length when joined with spaces
+        buf = []
+        buf_len = 0
         
         for i, sentence in enumerate(sentences):
             # Add the period back (except for last sentence)
             sentence_with_period = sentence + ('.' if i < len(sentences) - 1 else '')
             
             # Check if adding this sentence would exceed limit
-            test_content = current_thread + (' ' if current_thread else '') + sentence_with_period
+            add_len = len(sentence_with_period) + (1 if buf else 0)
             
-            if len(test_content) <= max_length:
-                current_thread = test_content
+            if buf_len + add_len <= max_length:
+                buf.append(sentence_with_period)
+                buf_len += add_len
             else:
                 # Current thread is full, start new one
-                if current_thread:
-                    threads.append(current_thread.strip())
-                current_thread = sentence_with_period
+                if buf:
+                    threads.append(' '.join(buf).strip())
+                buf = [sentence_with_period]
+                buf_len = len(sentence_with_period)
         
         # Add the last thread
-        if current_thread:
-            threads.append(current_thread.strip())
+        if buf:
+            threads.append(' '.join(buf).strip())
         
         return threads
     
@@ -193,20 +301,23 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
         """Split content by words when sentence splitting isn't optimal."""
         words = content.split()
         threads = []
-        current_thread = ""
+        buf = []
+        buf_len = 0
         
         for word in words:
-            test_content = current_thread + (' ' if current_thread else '') + word
+            add_len = len(word) + (1 if buf else 0)
             
-            if len(test_content) <= max_length:
-                current_thread = test_content
+            if buf_len + add_len <= max_length:
+                buf.append(word)
+                buf_len += add_len
             else:
-                if current_thread:
-                    threads.append(current_thread.strip())
-                current_thread = word
+                if buf:
+                    threads.append(' '.join(buf))
+                buf = [word]
+                buf_len = len(word)
         
-        if current_thread:
-            threads.append(current_thread.strip())
+        if buf:
+            threads.append(' '.join(buf))
         
         return threads
     
@@ -215,35 +326,36 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
         if len(threads) < 2:
             return threads
         
-        # Combine the last two threads and try to split them more evenly
-        last_thread = threads.pop()
-        second_last = threads.pop()
+        # Combine the last two threads and try to split them more evenly;
+        # the list is only touched once a better split has been found
+        last_thread = threads[-1]
+        second_last = threads[-2]
         combined = f"{second_last} {last_thread}"
         
         # Split the combined content into two more balanced parts
         words = combined.split()
-        mid_point = len(words) // 2
-        
-        # Find the best split point near the middle
-        for offset in range(min(10, len(words) // 4)):  # Look within 10 words of midpoint
-            for direction in [0, 1, -1]:  # Try exact midpoint, then +/- offset
-                split_idx = mid_point + (direction * offset)
-                if 0 < split_idx < len(words):
-                    first_part = ' '.join(words[:split_idx])
-                    second_part = ' '.join(words[split_idx:])
-                    
-                    # Check if both parts fit within limits
-                    if len(first_part) <= max_length and len(second_part) <= max_length:
-                        # Check if this is more balanced than before
-                        old_min_length = min(len(second_last), len(last_thread))
-                        new_min_length = min(len(first_part), len(second_part))
-                        
-                        if new_min_length > old_min_length:
-                            threads.extend([first_part, second_part])
-                            return threads
-        
-        # If redistribution didn't work better, keep original
-        threads.extend([second_last, last_thread])
+        
+        # prefix[k] is the total length of the first k words, so ' '.join(words[:k])
+        # is prefix[k] + k - 1 chars long without building the string
+        prefix = list(accumulate((len(word) for word in words), initial=0))
+        total_length = prefix[-1] + len(words) - 1
+        
+        # Find the most balanced split where both parts fit within limits
+        best_idx = None
+        best_min_length = min(len(second_last), len(last_thread))
+        for split_idx in range(1, len(words)):
+            first_length = prefix[split_idx] + split_idx - 1
+            second_length = total_length - first_length - 1
+            if first_length <= max_length and second_length <= max_length:
+                new_min_length = min(first_length, second_length)
+                if new_min_length > best_min_length:
+                    best_idx = split_idx
+                    best_min_length = new_min_length
+        
+        # Keep the original pair unless a better split was found
+        if best_idx is not None:
+            threads[-2:] = [' '.join(words[:best_idx]), ' '.join(words[best_idx:])]
+        
         return threads
     
     def post_content(self, content: str, media_urls: List[str] = None) -> Tuple[bool, str]:
@@ -251,60 +363,64 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
         if not self.is_connected:
             return False, "Not connected to Bluesky"
         
+        self._refresh_if_expiring()
+        
         try:
-            print(f"🔍 Original content length: {len(content)} characters")
+            log.debug("🔍 Original content length: %d characters", len(content))
             
             # Split content into threads if needed
             threads = self._split_content_intelligently(content)
             
-            print(f"🧵 Content split into {len(threads)} thread(s)")
-            for i, thread in enumerate(threads):
-                print(f"   Thread {i+1}: {len(thread)} chars - '{thread[:50]}...'")
+            log.debug("🧵 Content split into %d thread(s)", len(threads))
+            if log.isEnabledFor(logging.DEBUG):
+                for i, thread in enumerate(threads):
+                    log.debug("   Thread %d: %d chars - %r...", i + 1, len(thread), thread[:50])
             
             if len(threads) == 1:
-                print(f"📝 Posting as single message")
+                log.debug("📝 Posting as single message")
                 return self._post_single(threads[0])
             else:
-                print(f"🧵 Posting as {len(threads)}-part thread")
+                log.debug("🧵 Posting as %d-part thread", len(threads))
                 return self._post_thread(threads)
                 
         except Exception as e:
-            print(f"💥 Bluesky post exception: {str(e)}")
-            import traceback
-            print(f"Full traceback: {traceback.format_exc()}")
+            log.error("💥 Bluesky post exception: %s", e)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Full traceback: %s", traceback.format_exc())
             return False, f"Bluesky post error: {str(e)}"
     
+    def _build_post_data(self, text: str, created_at: datetime, reply: Optional[Dict] = None) -> Dict:
+        """Build a createRecord payload for a Bluesky post, optionally as a reply."""
+        post_record = {
+            "text": text,
+            "createdAt": _format_created_at(created_at)
+        }
+        if reply:
+            post_record["reply"] = reply
+        
+        return {
+            "repo": self.user_info["did"],
+            "collection": "app.bsky.feed.post",
+            "record": post_record
+        }
+    
     def _post_single(self, content: str) -> Tuple[bool, str]:
         """Post a single message to Bluesky."""
         try:
             post_url = f"{self.base_url}/xrpc/com.atproto.repo.createRecord"
+            headers = {"Authorization": f"Bearer {self.access_jwt}"}
+            post_data = self._build_post_data(content, datetime.now(timezone.utc))
             
-            headers = {
-                "Authorization": f"Bearer {self.access_jwt}",
-                "Content-Type": "application/json"
-            }
-            
-            post_record = {
-                "text": content,
-                "createdAt": datetime.utcnow().isoformat() + "Z"
-            }
-            
-            post_data = {
-                "repo": self.user_info["did"],
-                "collection": "app.bsky.feed.post",
-                "record": post_record
-            }
-            
-            print(f"📤 Posting single message to Bluesky...")
-            response = requests.post(post_url, headers=headers, json=post_data)
+            log.debug("📤 Posting single message to Bluesky...")
+            response = self._http.post(post_url, headers=headers, data=orjson.dumps(post_data))
+            result = _parse_response(response)
             
             if response.status_code == 200:
-                result = response.json()
                 post_uri = result.get("uri", "")
                 return True, f"Posted successfully to Bluesky! URI: {post_uri}"
             else:
-                error_msg = response.json().get("message", "Post failed")
-                print(f"❌ Single post failed: {error_msg}")
+                error_msg = result.get("message", "Post failed")
+                log.warning("❌ Single post failed: %s", error_msg)
                 return False, f"Bluesky post failed: {error_msg}"
                 
         except Exception as e:
@@ -317,53 +433,32 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
             root_post = None
             parent_post = None
             
+            # One clock read per thread; each segment is offset by 1µs so
+            # createdAt stays strictly increasing in thread order
+            base_ts = datetime.now(timezone.utc)
+            
+            post_url = f"{self.base_url}/xrpc/com.atproto.repo.createRecord"
+            headers = {"Authorization": f"Bearer {self.access_jwt}"}
+            
             for i, thread_content in enumerate(threads):
-                print(f"📤 Posting thread {i+1}/{len(threads)}: {thread_content[:50]}...")
-                
-                # Add small delay between posts to avoid rate limiting
-                if i > 0:
-                    time.sleep(0.5)
-                
-                post_url = f"{self.base_url}/xrpc/com.atproto.repo.createRecord"
-                
-                headers = {
-                    "Authorization": f"Bearer {self.access_jwt}",
-                    "Content-Type": "application/json"
-                }
-                
-                # Build post record
-                post_record = {
-                    "text": thread_content,
-                    "createdAt": datetime.utcnow().isoformat() + "Z"
-                }
+                log.debug("📤 Posting thread %d/%d: %s...", i + 1, len(threads), thread_content[:50])
                 
                 # Add reply structure for threaded posts (posts 2 and onwards)
+                reply = None
                 if i > 0 and root_post and parent_post:
-                    post_record["reply"] = {
-                        "root": {
-                            "uri": root_post["uri"],
-                            "cid": root_post["cid"]
-                        },
-                        "parent": {
-                            "uri": parent_post["uri"],
-                            "cid": parent_post["cid"]
-                        }
-                    }
-                    print(f"🔗 Adding reply structure - Root: {root_post['uri'][:30]}...")
+                    reply = {"root": root_post, "parent": parent_post}
+                    log.debug("🔗 Adding reply structure - Root: %s...", root_post['uri'][:30])
                 
-                post_data = {
-                    "repo": self.user_info["did"],
-                    "collection": "app.bsky.feed.post", 
-                    "record": post_record
-                }
+                post_data = self._build_post_data(thread_content, base_ts + timedelta(microseconds=i), reply)
                 
-                print(f"🌐 Making POST request to: {post_url}")
-                response = requests.post(post_url, headers=headers, json=post_data)
+                log.debug("🌐 Making POST request to: %s", post_url)
+                response = self._http.post(post_url, headers=headers, data=orjson.dumps(post_data))
                 
-                print(f"📥 Response status: {response.status_code}")
+                result = _parse_response(response)
+                
+                log.debug("📥 Response status: %d", response.status_code)
                 
                 if response.status_code == 200:
-                    result = response.json()
                     current_uri = result.get("uri", "")
                     current_cid = result.get("cid", "")
                     
@@ -377,35 +472,42 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
                     # Set root and parent for next post
                     if i == 0:
                         root_post = current_post
-                        print(f"🌳 Root post established: {current_uri}")
+                        log.debug("🌳 Root post established: %s", current_uri)
                     parent_post = current_post
                     
-                    print(f"✅ Thread {i+1}/{len(threads)} posted successfully!")
-                    print(f"   URI: {current_uri}")
-                    print(f"   CID: {current_cid}")
+                    log.debug("✅ Thread %d/%d posted successfully! URI: %s CID: %s",
+                              i + 1, len(threads), current_uri, current_cid)
                     
                 else:
-                    error_data = response.json() if response.content else {}
-                    error_msg = error_data.get("message", "Post failed")
-                    print(f"❌ Thread {i+1} failed: {error_msg}")
-                    print(f"   Full response: {response.text}")
+                    error_msg = result.get("message", "Post failed")
+                    log.warning("❌ Thread %d failed: %s", i + 1, error_msg)
+                    log.debug("   Full response: %s", result)
                     
                     # Return partial success if some posts succeeded
                     if posted_uris:
-                        return True, f"Thread partially posted: {len(posted_uris)}/{len(threads)} posts successful. Check terminal for details."
+                        return True, f"Thread partially posted: {len(posted_uris)}/{len(threads)} posts successful. Check the terminal for the error (LOG_LEVEL=DEBUG for full responses)."
                     else:
                         return False, f"Thread posting failed at post {i+1}: {error_msg}"
             
             # All posts successful
-            print(f"🎉 Complete thread posted successfully!")
+            log.info("🎉 Complete thread posted successfully!")
             return True, f"Thread posted successfully! {len(threads)} posts created as connected thread"
             
         except Exception as e:
-            print(f"💥 Thread posting exception: {str(e)}")
-            import traceback
-            print(f"Full traceback: {traceback.format_exc()}")
+            log.error("💥 Thread posting exception: %s", e)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Full traceback: %s", traceback.format_exc())
             return False, f"Thread posting error: {str(e)}"
     
+    def _refresh_if_expiring(self):
+        """Refresh the access token ahead of expiry rather than failing a post with 401."""
+        if self._access_exp is None:
+            # Tokens restored from session state have not been decoded yet
+            self._access_exp = _jwt_expiry(self.access_jwt)
+        if self._access_exp is not None and time.time() > self._access_exp - TOKEN_REFRESH_MARGIN:
+            log.debug("🔄 Bluesky access token expiring, refreshing session")
+            self.refresh_session()
+    
     def refresh_session(self) -> bool:
         """Refresh the access token."""
         if not self.refresh_jwt:
@@ -413,14 +515,16 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
         
         try:
             refresh_url = f"{self.base_url}/xrpc/com.atproto.server.refreshSession"
-            headers = {"Authorization": f"Bearer {self.refresh_jwt}"}
+            # refreshSession takes no request body, so drop the JSON content type
+            headers = {"Authorization": f"Bearer {self.refresh_jwt}", "Content-Type": None}
             
-            response = requests.post(refresh_url, headers=headers)
+            response = self._http.post(refresh_url, headers=headers)
             
             if response.status_code == 200:
-                session_info = response.json()
+                session_info = _parse_response(response)
                 self.access_jwt = session_info.get("accessJwt")
                 self.refresh_jwt = session_info.get("refreshJwt")
+                self._access_exp = _jwt_expiry(self.access_jwt)
                 return True
             
         except Exception:
@@ -431,10 +535,13 @@ class BlueskyIntegration(SocialMediaIntegrationBase):
 class LinkedInIntegration(SocialMediaIntegrationBase):
     """LinkedIn integration - FREE TIER (Real API)"""
     
+    session_token_attrs = ("access_token",)
+    
     def __init__(self):
         super().__init__("LinkedIn")
         self.api_base = "https://api.linkedin.com/v2"
         self.access_token = None
+        self._http = _create_http_session()
     
     def connect(self, credentials: Dict) -> Tuple[bool, str]:
         """Connect to LinkedIn using access token."""
@@ -460,24 +567,20 @@ class LinkedInIntegration(SocialMediaIntegrationBase):
             self.access_token = access_token
             
             # Verify token by getting user profile
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
+            headers = {"Authorization": f"Bearer {access_token}"}
             
-            print(f"🔍 DEBUG - LinkedIn API Request:")
-            print(f"Token length: {len(access_token)}")
-            print(f"Headers: Authorization: Bearer [HIDDEN]")
+            log.debug("🔍 LinkedIn API request: token %d chars, Authorization: Bearer [HIDDEN]", len(access_token))
             
             # Get user profile to verify token
             profile_url = f"{self.api_base}/people/~?projection=(id,firstName,lastName,profilePicture(displayImage~:playableStreams))"
             
-            response = requests.get(profile_url, headers=headers)
+            response = self._http.get(profile_url, headers=headers)
             
-            print(f"📥 LinkedIn Response status: {response.status_code}")
+            profile_data = _parse_response(response)
+            
+            log.debug("📥 LinkedIn Response status: %d", response.status_code)
             
             if response.status_code == 200:
-                profile_data = response.json()
                 self.user_info = {
                     "id": profile_data.get("id"),
                     "firstName": profile_data.get("firstName", {}).get("localized", {}).get("en_US", ""),
@@ -486,18 +589,22 @@ class LinkedInIntegration(SocialMediaIntegrationBase):
                     "profile_url": f"https://linkedin.com/in/{profile_data.get('id', '')}"
                 }
                 self.is_connected = True
-                print(f"✅ LinkedIn connection successful! User: {self.user_info['name']}")
+                log.info("✅ LinkedIn connection successful! User: %s", self.user_info['name'])
                 return True, f"Successfully connected to LinkedIn as {self.user_info['name']}"
             else:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get("message", "Invalid access token")
-                print(f"❌ LinkedIn connection failed: {error_msg}")
+                error_msg = profile_data.get("message", "Invalid access token")
+                log.warning("❌ LinkedIn connection failed (HTTP %d): %s", response.status_code, error_msg)
                 return False, f"LinkedIn connection failed: {error_msg}"
                 
         except Exception as e:
-            print(f"💥 LinkedIn exception: {str(e)}")
+            log.error("💥 LinkedIn exception: %s", e)
             return False, f"LinkedIn connection error: {str(e)}"
     
+    def disconnect(self):
+        """Disconnect from LinkedIn and release pooled connections."""
+        super().disconnect()
+        self._http.close()
+    
     def post_content(self, content: str, media_urls: List[str] = None) -> Tuple[bool, str]:
         """Post content to LinkedIn."""
         if not self.is_connected:
@@ -512,7 +619,6 @@ class LinkedInIntegration(SocialMediaIntegrationBase):
             # Real LinkedIn posting
             headers = {
                 "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json",
                 "X-Restli-Protocol-Version": "2.0.0"
             }
             
@@ -535,25 +641,24 @@ class LinkedInIntegration(SocialMediaIntegrationBase):
                 }
             }
             
-            print(f"🌐 Posting to LinkedIn...")
-            print(f"📤 Post data: {{'text': '{content[:50]}...', 'visibility': 'PUBLIC'}}")
+            log.debug("🌐 Posting to LinkedIn: text=%r..., visibility=PUBLIC", content[:50])
             
-            response = requests.post(post_url, headers=headers, json=post_data)
+            response = self._http.post(post_url, headers=headers, data=orjson.dumps(post_data))
             
-            print(f"📥 LinkedIn post response: {response.status_code}")
+            result = _parse_response(response)
+            
+            log.debug("📥 LinkedIn post response: %d", response.status_code)
             
             if response.status_code == 201:
-                result = response.json()
                 post_id = result.get("id", "")
                 return True, f"Posted successfully to LinkedIn! Post ID: {post_id}"
             else:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get("message", "Post failed")
-                print(f"❌ LinkedIn post failed: {error_msg}")
+                error_msg = result.get("message", "Post failed")
+                log.warning("❌ LinkedIn post failed: %s", error_msg)
                 return False, f"LinkedIn post failed: {error_msg}"
                 
         except Exception as e:
-            print(f"💥 LinkedIn post exception: {str(e)}")
+            log.error("💥 LinkedIn post exception: %s", e)
             return False, f"LinkedIn post error: {str(e)}"
 
 class TwitterIntegration(SocialMediaIntegrationBase):
@@ -665,80 +770,151 @@ class SocialMediaManager:
             for name, platform in self.platforms.items()
         }
     
-    def post_to_multiple_platforms(self, content_dict: Dict[str, str], selected_platforms: List[str]) -> Dict[str, Tuple[bool, str]]:
-        """Post content to multiple platforms simultaneously."""
-        results = {}
+    def post_to_multiple_platforms(self, content_dict: Dict[str, str], selected_platforms: List[str],
+                                   on_result: Optional[Callable[[str, Tuple[bool, str]], None]] = None) -> Dict[str, Tuple[bool, str]]:
+        """Post content to multiple platforms simultaneously.
         
-        for platform_name in selected_platforms:
-            platform = self.get_platform(platform_name)
-            if platform and platform.is_connected:
-                content = content_dict.get(platform_name, "")
-                if content:
-                    success, message = platform.post_content(content)
-                    results[platform_name] = (success, message)
-                else:
-                    results[platform_name] = (False, "No content provided for this platform")
+        on_result, if given, is called in the caller's thread with (platform, result)
+        as each platform finishes, so UIs can report progress while others are still posting.
+        """
+        # Resolve every selection once, then split into postable work and errors
+        platforms_map = {name: self.platforms.get(name.lower()) for name in selected_platforms}
+        results = {}
+        work = []
+        for name, platform in platforms_map.items():
+            content = content_dict.get(name, "")
+            if not (platform and platform.is_connected):
+                results[name] = (False, "Platform not connected")
+            elif not content:
+                results[name] = (False, "No content provided for this platform")
             else:
-                results[platform_name] = (False, "Platform not connected")
+                work.append((name, platform, content))
+                continue
+            if on_result:
+                on_result(name, results[name])
         
-        return results
+        # Each post is a blocking HTTP round-trip, so run the platforms concurrently
+        if work:
+            with ThreadPoolExecutor(max_workers=len(work)) as executor:
+                futures = {
+                    executor.submit(platform.post_content, content): name
+                    for name, platform, content in work
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        results[name] = (False, f"Post error: {str(e)}")
+                    if on_result:
+                        on_result(name, results[name])
+        
+        # Report in selection order
+        return {name: results[name] for name in platforms_map}
     
     def save_connections(self):
         """Save connection states (for demo persistence)."""
         # In a real app, you'd save encrypted tokens to a secure database
         # For hackathon demo, we'll use Streamlit session state
-        if 'social_connections' not in st.session_state:
-            st.session_state.social_connections = {}
-        
+        # Each platform has its own session key, rewritten only when its state changed
         for name, platform in self.platforms.items():
-            st.session_state.social_connections[name] = {
+            data = {
                 "connected": platform.is_connected,
-                "user_info": platform.user_info
+                "user_info": dict(platform.user_info),
+                "tokens": {attr: getattr(platform, attr) for attr in platform.session_token_attrs}
             }
+            key = f"_sc_{name}"
+            if st.session_state.get(key) != data:
+                st.session_state[key] = data
     
     def load_connections(self):
         """Load saved connection states."""
-        if 'social_connections' in st.session_state:
-            for name, data in st.session_state.social_connections.items():
-                if name in self.platforms:
-                    platform = self.platforms[name]
-                    platform.is_connected = data.get("connected", False)
-                    platform.user_info = data.get("user_info", {})
+        # One-shot migration from the old single social_connections dict
+        legacy = st.session_state.pop('social_connections', None)
+        if legacy:
+            for name, data in legacy.items():
+                st.session_state.setdefault(f"_sc_{name}", data)
+        
+        for name, platform in self.platforms.items():
+            data = st.session_state.get(f"_sc_{name}")
+            if data is None:
+                continue
+            platform.is_connected = data.get("connected", False)
+            platform.user_info = data.get("user_info", {})
+            for attr, value in data.get("tokens", {}).items():
+                if attr in platform.session_token_attrs:
+                    setattr(platform, attr, value)
 
 # Utility functions for the UI
-def get_platform_tier_info() -> Dict[str, Dict]:
+def get_social_manager() -> SocialMediaManager:
+    """Get this browser session's SocialMediaManager, creating it on first use."""
+    # Kept in session state rather than st.cache_resource: the manager holds
+    # per-user tokens, and cache_resource would share it across every session
+    if 'social_manager' not in st.session_state:
+        st.session_state.social_manager = SocialMediaManager()
+    manager = st.session_state.social_manager
+    _flush_save_if_due(manager)
+    return manager
+
+# Connect/disconnect saves are coalesced and written once this window has passed
+SAVE_DEBOUNCE_SECONDS = 0.05
+
+def _schedule_save():
+    """Mark the connection state dirty; the next due flush writes it once."""
+    st.session_state._pending_save = True
+    st.session_state._save_deadline = time.monotonic() + SAVE_DEBOUNCE_SECONDS
+
+def _flush_save_if_due(manager: SocialMediaManager):
+    """Save connections if a save is pending and its debounce window has passed."""
+    if st.session_state.get('_pending_save') and time.monotonic() >= st.session_state.get('_save_deadline', 0):
+        st.session_state._pending_save = False
+        manager.save_connections()
+
+# Static tier/status info per platform, shared read-only across reruns
+_PLATFORM_TIER_INFO: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "bluesky": MappingProxyType({
+        "tier": "Free",
+        "status": "Live posting + intelligent threading",
+        "color": "green", 
+        "icon": "🆓"
+    }),
+    "linkedin": MappingProxyType({
+        "tier": "Free",
+        "status": "Live API integration available",
+        "color": "blue",
+        "icon": "🆓"
+    }),
+    "twitter": MappingProxyType({
+        "tier": "Premium", 
+        "status": "$100+/month API required",
+        "color": "orange",
+        "icon": "💎"
+    }),
+    "threads": MappingProxyType({
+        "tier": "Premium",
+        "status": "Business verification required", 
+        "color": "red",
+        "icon": "💎"
+    })
+})
+
+def get_platform_tier_info() -> Mapping[str, Mapping[str, str]]:
     """Get platform tier information for UI display."""
-    return {
-        "bluesky": {
-            "tier": "Free",
-            "status": "Live posting + intelligent threading",
-            "color": "green", 
-            "icon": "🆓"
-        },
-        "linkedin": {
-            "tier": "Free",
-            "status": "Live API integration available",
-            "color": "blue",
-            "icon": "🆓"
-        },
-        "twitter": {
-            "tier": "Premium", 
-            "status": "$100+/month API required",
-            "color": "orange",
-            "icon": "💎"
-        },
-        "threads": {
-            "tier": "Premium",
-            "status": "Business verification required", 
-            "color": "red",
-            "icon": "💎"
-        }
-    }
+    return _PLATFORM_TIER_INFO
+
+# Heading and steps shown together in the LinkedIn access-token tab
+_LINKEDIN_HELP_MD = """**How to get LinkedIn Access Token:**
+
+1. Go to [LinkedIn Developer Portal](https://developer.linkedin.com/)
+2. Create a new app or use existing one
+3. Get your Access Token from the app dashboard
+4. Ensure your app has 'w_member_social' permission"""
 
 def display_platform_connection_ui(manager: SocialMediaManager, platform_name: str):
     """Display connection UI for a specific platform."""
     platform = manager.get_platform(platform_name)
     tier_info = get_platform_tier_info()[platform_name]
+    platform_title = platform_name.title()
     
     # Platform header
     col1, col2, col3 = st.columns([1, 3, 1])
@@ -747,8 +923,7 @@ def display_platform_connection_ui(manager: SocialMediaManager, platform_name: s
         st.markdown(f"## {tier_info['icon']}")
     
     with col2:
-        st.markdown(f"### {platform_name.title()}")
-        st.markdown(f"**Tier:** {tier_info['tier']} | **Status:** {tier_info['status']}")
+        st.markdown(f"### {platform_title}\n\n**Tier:** {tier_info['tier']} | **Status:** {tier_info['status']}")
     
     with col3:
         if platform.is_connected:
@@ -758,16 +933,19 @@ def display_platform_connection_ui(manager: SocialMediaManager, platform_name: s
     
     # Connection form
     if not platform.is_connected:
-        with st.expander(f"Connect to {platform_name.title()}", expanded=False):
+        with st.expander(f"Connect to {platform_title}", expanded=False):
             if platform_name == "bluesky":
                 st.markdown("**Enter your Bluesky credentials:**")
                 st.info("💡 **Tip:** Use your email address instead of handle for better compatibility")
                 
-                username = st.text_input("Bluesky Email/Username", key=f"{platform_name}_username", 
-                                        placeholder="your-email@domain.com or username.bsky.social")
-                password = st.text_input("Bluesky Password", type="password", key=f"{platform_name}_password")
+                # Inside a form, typing doesn't rerun the script; values arrive on submit
+                with st.form(f"{platform_name}_form", clear_on_submit=False):
+                    username = st.text_input("Bluesky Email/Username", key=f"{platform_name}_username", 
+                                            placeholder="your-email@domain.com or username.bsky.social")
+                    password = st.text_input("Bluesky Password", type="password", key=f"{platform_name}_password")
+                    submitted = st.form_submit_button(f"Connect to {platform_title}")
                 
-                if st.button(f"Connect to {platform_name.title()}", key=f"{platform_name}_connect"):
+                if submitted:
                     if username and password:
                         success, message = platform.connect({
                             "username": username,
@@ -775,11 +953,13 @@ def display_platform_connection_ui(manager: SocialMediaManager, platform_name: s
                         })
                         if success:
                             st.success(message)
-                            manager.save_connections()
+                            # Don't leave the raw password sitting in widget state
+                            del st.session_state[f"{platform_name}_password"]
+                            _schedule_save()
                             st.rerun()
                         else:
                             st.error(message)
-                            st.info("🔧 **Troubleshooting:** Check the terminal/console for detailed debug information")
+                            st.info("🔧 **Troubleshooting:** Check the terminal/console for the error; set `LOG_LEVEL=DEBUG` for full request/response details")
                     else:
                         st.error("Please enter both email/username and password")
             
@@ -790,33 +970,30 @@ def display_platform_connection_ui(manager: SocialMediaManager, platform_name: s
                 linkedin_tabs = st.tabs(["🔑 Use Access Token", "🎭 Demo Mode"])
                 
                 with linkedin_tabs[0]:
-                    st.info("**How to get LinkedIn Access Token:**")
-                    st.markdown("""
-                    1. Go to [LinkedIn Developer Portal](https://developer.linkedin.com/)
-                    2. Create a new app or use existing one
-                    3. Get your Access Token from the app dashboard
-                    4. Ensure your app has 'w_member_social' permission
-                    """)
+                    st.info(_LINKEDIN_HELP_MD)
                     
-                    access_token = st.text_input(
-                        "LinkedIn Access Token", 
-                        type="password", 
-                        key=f"{platform_name}_access_token",
-                        placeholder="Enter your LinkedIn access token here"
-                    )
+                    with st.form(f"{platform_name}_token_form", clear_on_submit=False):
+                        access_token = st.text_input(
+                            "LinkedIn Access Token", 
+                            type="password", 
+                            key=f"{platform_name}_access_token",
+                            placeholder="Enter your LinkedIn access token here"
+                        )
+                        submitted = st.form_submit_button("Connect with Real LinkedIn API")
                     
-                    if st.button(f"Connect with Real LinkedIn API", key=f"{platform_name}_real_connect"):
+                    if submitted:
                         if access_token:
                             success, message = platform.connect({
                                 "access_token": access_token
                             })
                             if success:
                                 st.success(message)
-                                manager.save_connections()
+                                del st.session_state[f"{platform_name}_access_token"]
+                                _schedule_save()
                                 st.rerun()
                             else:
                                 st.error(message)
-                                st.info("🔧 **Check terminal for detailed error information**")
+                                st.info("🔧 **Check the terminal for the error; set `LOG_LEVEL=DEBUG` for full request/response details**")
                         else:
                             st.error("Please enter your LinkedIn access token")
                 
@@ -827,16 +1004,16 @@ def display_platform_connection_ui(manager: SocialMediaManager, platform_name: s
                         success, message = platform.connect({"demo": True})
                         if success:
                             st.success(message)
-                            manager.save_connections()
+                            _schedule_save()
                             st.rerun()
             
             else:
-                st.info(f"This is a demo connection for {platform_name.title()}. Click to simulate connection.")
-                if st.button(f"Demo Connect to {platform_name.title()}", key=f"{platform_name}_demo_connect"):
+                st.info(f"This is a demo connection for {platform_title}. Click to simulate connection.")
+                if st.button(f"Demo Connect to {platform_title}", key=f"{platform_name}_demo_connect"):
                     success, message = platform.connect({"demo": True})
                     if success:
                         st.success(message)
-                        manager.save_connections()
+                        _schedule_save()
                         st.rerun()
     
     else:
@@ -845,9 +1022,9 @@ def display_platform_connection_ui(manager: SocialMediaManager, platform_name: s
             st.success(f"✅ **Connected as:** {platform.user_info.get('name', 'LinkedIn User')}")
             st.info(f"**Profile:** {platform.user_info.get('profile_url', 'N/A')}")
         else:
-            st.info(f"Connected as: {platform.user_info.get('handle', platform.user_info.get('name', 'User'))}")
+            st.info(f"Connected as: {platform.display_name}")
         
-        if st.button(f"Disconnect from {platform_name.title()}", key=f"{platform_name}_disconnect"):
+        if st.button(f"Disconnect from {platform_title}", key=f"{platform_name}_disconnect"):
             platform.disconnect()
-            manager.save_connections()
+            _schedule_save()
             st.rerun()
@@ -5,7 +5,7 @@ import os
 # Add the src directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from content_formatter import format_content_for_platform
+from content_formatter import ContentFormatter
 
 def test_content_formatting():
     """
@@ -22,18 +22,15 @@ The rise of specialized AI models trained for specific industries is another key
 Responsible AI development remains critical. Organizations are increasingly adopting transparent AI governance frameworks to address ethical concerns and regulatory requirements.
     """
     
-    topic = "ai_trends"
-    content_type = "trend_analysis"
+    formatter = ContentFormatter()
     
     # Format content for each platform
     platforms = ["linkedin", "twitter", "bluesky", "threads"]
     formatted_results = {}
     
     for platform in platforms:
-        formatted_content = format_content_for_platform(
+        formatted_content = formatter.format_for_platform(
             content=sample_content,
-            topic=topic,
-            content_type=content_type,
             platform=platform
         )
         formatted_results[platform] = {
@@ -41,6 +38,14 @@ Responsible AI development remains critical. Organizations are increasingly adop
             "char_count": len(formatted_content)
         }
     
+    # Every platform gets non-empty content within its character limit
+    for platform, result in formatted_results.items():
+        char_limit = formatter.get_platform_info(platform)["char_limit"]
+        assert result["content"].strip(), f"{platform} content is empty"
+        assert result["char_count"] <= char_limit, (
+            f"{platform} content is {result['char_count']} chars, limit {char_limit}"
+        )
+    
     # Print results
     print("Content Formatting Results:\n")
     for platform, result in formatted_results.items():
@@ -0,0 +1,45 @@
+import sqlite3
+import sys
+import os
+import threading
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database import ContentDatabase
+
+def test_store_content_per_database(tmp_path):
+    """
+    Rows queued through the shared writer land only in their own database.
+    """
+    first = ContentDatabase(str(tmp_path / "first.db"))
+    second = ContentDatabase(str(tmp_path / "second.db"))
+
+    assert first.store_content("AI", "twitter", "first post", {"n": 1})
+    assert second.store_content("ML", "bluesky", "second post")
+    assert first.store_content("AI", "linkedin", "another first post")
+
+    # get_content_history flushes the queue before reading
+    first_rows = first.get_content_history()
+    second_rows = second.get_content_history()
+
+    assert sorted(row[2] for row in first_rows) == ["another first post", "first post"]
+    assert [row[2] for row in second_rows] == ["second post"]
+    assert second_rows[0][3] is None
+
+def test_failed_write_does_not_block_flush(tmp_path):
+    """
+    A batch that fails to insert is still marked done, so flush() returns.
+    """
+    db_path = str(tmp_path / "broken.db")
+    db = ContentDatabase(db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE content_history")
+
+    # Queued, even though the write will fail
+    assert db.store_content("AI", "twitter", "lost post")
+
+    flusher = threading.Thread(target=db.flush, daemon=True)
+    flusher.start()
+    flusher.join(timeout=5)
+    assert not flusher.is_alive(), "flush() hung after a failed write"
@@ -0,0 +1,116 @@
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from social_integrations import BlueskyIntegration, RETRY_AFTER_CAP, _create_http_session
+
+def test_clean_existing_thread_indicators():
+    """
+    Thread indicators are stripped, but fractions that start a later line are kept.
+    """
+    bluesky = BlueskyIntegration()
+
+    assert bluesky._clean_existing_thread_indicators("1/3: AI is here (1/3)") == "AI is here"
+    assert bluesky._clean_existing_thread_indicators("**Thread 2/3*** More text") == "More text"
+    assert bluesky._clean_existing_thread_indicators(
+        "Survey results:\n3/4 of developers use AI"
+    ) == "Survey results: 3/4 of developers use AI"
+    assert bluesky._clean_existing_thread_indicators(
+        "Recipe:\n1/2 cup sugar"
+    ) == "Recipe: 1/2 cup sugar"
+
+def test_split_by_sentences():
+    """
+    Sentences are packed greedily into threads that stay within max_length.
+    """
+    bluesky = BlueskyIntegration()
+    content = "First sentence here. Second one is a bit longer. Third. A fourth sentence closes it"
+
+    threads = bluesky._split_by_sentences(content, 40)
+
+    assert threads == [
+        "First sentence here.",
+        "Second one is a bit longer. Third.",
+        "A fourth sentence closes it",
+    ]
+    assert all(len(thread) <= 40 for thread in threads)
+    assert ' '.join(threads) == content
+
+def test_split_by_words():
+    """
+    Words are packed greedily into threads that stay within max_length.
+    """
+    bluesky = BlueskyIntegration()
+    content = "one two three four five six seven eight nine ten"
+
+    threads = bluesky._split_by_words(content, 15)
+
+    assert threads == ["one two three", "four five six", "seven eight", "nine ten"]
+    assert all(len(thread) <= 15 for thread in threads)
+    assert ' '.join(threads) == content
+
+def test_redistribute_short_thread_balances_last_pair():
+    """
+    A short last thread is merged with the one before it and split at the most balanced point.
+    """
+    bluesky = BlueskyIntegration()
+    words = [f"word{i}" for i in range(12)]
+    threads = ["intro", ' '.join(words[:11]), words[11]]
+
+    result = bluesky._redistribute_short_thread(list(threads), 70)
+
+    assert result[0] == "intro"
+    assert result[1:] == [' '.join(words[:6]), ' '.join(words[6:])]
+    assert ' '.join(result) == ' '.join(threads)
+    assert all(len(thread) <= 70 for thread in result)
+
+def test_redistribute_short_thread_handles_few_words():
+    """
+    Pairs with only a few words are still rebalanced.
+    """
+    bluesky = BlueskyIntegration()
+
+    assert bluesky._redistribute_short_thread(["aaaa bbbb", "c"], 20) == ["aaaa", "bbbb c"]
+
+def test_redistribute_short_thread_respects_max_length():
+    """
+    No split may push either thread over max_length, even if it would be more balanced.
+    """
+    bluesky = BlueskyIntegration()
+    threads = ["x" * 10 + " " + "y" * 25, "z"]
+
+    result = bluesky._redistribute_short_thread(list(threads), 27)
+
+    assert result == ["x" * 10, "y" * 25 + " z"]
+    assert all(len(thread) <= 27 for thread in result)
+
+def test_redistribute_short_thread_keeps_original_pair():
+    """
+    The original threads are returned unchanged when no split is more balanced.
+    """
+    bluesky = BlueskyIntegration()
+
+    # A single word per thread leaves only the original split point
+    assert bluesky._redistribute_short_thread(["longword", "short"], 20) == ["longword", "short"]
+    # Any other split would overflow max_length
+    assert bluesky._redistribute_short_thread(["aa " + "b" * 14, "ccc"], 17) == ["aa " + "b" * 14, "ccc"]
+    # A single thread has nothing to redistribute
+    assert bluesky._redistribute_short_thread(["only"], 20) == ["only"]
+
+def test_retry_after_is_capped():
+    """
+    A long server-sent Retry-After is clamped so a rate limit can't stall the UI.
+    """
+    retry = _create_http_session().get_adapter("https://bsky.social").max_retries
+
+    class Response:
+        headers = {"Retry-After": "3600"}
+
+    assert retry.get_retry_after(Response()) == RETRY_AFTER_CAP
+    Response.headers = {"Retry-After": "1"}
+    assert retry.get_retry_after(Response()) == 1
+    # Subsequent retry states keep the cap
+    Response.headers = {"Retry-After": "3600"}
+    assert retry.increment("POST", "/xrpc/com.atproto.repo.createRecord").get_retry_after(Response()) == RETRY_AFTER_CAP
@@ -0,0 +1,17 @@
+import sys
+import os
+from datetime import date, datetime
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import format_timestamp
+
+def test_format_timestamp():
+    """
+    ISO strings, datetimes and dates format alike; unparseable strings pass through.
+    """
+    assert format_timestamp("2024-01-02T03:04:05") == "2024-01-02 03:04:05"
+    assert format_timestamp(datetime(2024, 1, 2, 3, 4, 5)) == "2024-01-02 03:04:05"
+    assert format_timestamp(date(2024, 1, 2)) == "2024-01-02 00:00:00"
+    assert format_timestamp("not a timestamp") == "not a timestamp"